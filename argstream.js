@@ -129,6 +129,9 @@ function OutArgStream() {
     self._flushImmed = null;
     self.finished = false;
     self.frame = [Buffer(0)];
+    // chunks written to the last frame part within the current tick, joined
+    // once when the part is done rather than re-concatenated on every write
+    self._chunks = null;
     self.currentArgN = 2;
     self.arg2.on('data', function onArg2Data(chunk) {
         self._handleFrameChunk(2, chunk);
@@ -167,9 +170,11 @@ OutArgStream.prototype._handleFrameChunk = function _handleFrameChunk(n, chunk)
             }));
         }
         self.currentArgN++;
+        self._joinChunks();
         self.frame.push(chunk);
     } else if (chunk === null) {
         if (++self.currentArgN <= 3) {
+            self._joinChunks();
             self.frame.push(Buffer(0));
         }
     } else {
@@ -180,15 +185,27 @@ OutArgStream.prototype._handleFrameChunk = function _handleFrameChunk(n, chunk)
 
 OutArgStream.prototype._appendFrameChunk = function _appendFrameChunk(chunk) {
     var self = this;
+    if (self._chunks) {
+        self._chunks.push(chunk);
+        return;
+    }
     var i = self.frame.length - 1;
     var buf = self.frame[i];
     if (buf.length) {
-        self.frame[i] = Buffer.concat([buf, chunk]);
+        self._chunks = [buf, chunk];
     } else {
         self.frame[i] = chunk;
     }
 };
 
+OutArgStream.prototype._joinChunks = function _joinChunks() {
+    var self = this;
+    if (self._chunks) {
+        self.frame[self.frame.length - 1] = Buffer.concat(self._chunks);
+        self._chunks = null;
+    }
+};
+
 OutArgStream.prototype.deferFlushParts = function deferFlushParts() {
     var self = this;
     if (!self._flushImmed) {
@@ -206,6 +223,7 @@ OutArgStream.prototype._flushParts = function _flushParts(isLast) {
     }
     if (self.finished) return;
     isLast = Boolean(isLast);
+    self._joinChunks();
     var frame = self.frame;
     self.frame = [Buffer(0)];
     if (frame.length) self.frameEvent.emit(self, [frame, isLast]);
@@ -251,12 +269,57 @@ function bufferStreamData(stream, callback) {
         stream.removeListener('data', onData);
         stream.removeListener('error', finish);
         stream.removeListener('end', finish);
-        var buf = Buffer.concat(parts);
+        // a single part is already a slice of the frame it arrived in;
+        // Buffer.concat would copy it anyway
+        var buf = parts.length === 1 ? parts[0] : Buffer.concat(parts);
         stream.buf = buf;
         if (err === undefined) err = null;
         callback(err, buf);
     }
 }
 
+// Buffers both arg2 and arg3 of a streamed request or response, calling
+// callback(err, arg2, arg3) exactly once: with the first error to occur, or
+// once both values are ready.
+function bufferArg23(reqres, callback) {
+    var arg2 = null;
+    var arg3 = null;
+    var pending = 2;
+    var isSync = true;
+
+    reqres.arg2.onValueReady(onArg2Ready);
+    reqres.arg3.onValueReady(onArg3Ready);
+    isSync = false;
+
+    function onArg2Ready(err, buf) {
+        arg2 = buf;
+        onReady(err);
+    }
+
+    function onArg3Ready(err, buf) {
+        arg3 = buf;
+        onReady(err);
+    }
+
+    function onReady(err) {
+        if (--pending !== 0 && !err) return;
+        if (isSync) {
+            process.nextTick(function deferredFinish() {
+                finish(err);
+            });
+        } else {
+            finish(err);
+        }
+    }
+
+    function finish(err) {
+        if (!callback) return;
+        var cb = callback;
+        callback = null;
+        cb(err || null, arg2, arg3);
+    }
+}
+
 module.exports.InArgStream = InArgStream;
 module.exports.OutArgStream = OutArgStream;
+module.exports.bufferArg23 = bufferArg23;
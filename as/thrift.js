@@ -29,6 +29,10 @@ var errors = require('../errors.js');
 
 var HeaderRW = require('../v2/header.js').header2;
 
+// Most calls carry no application headers; the arg2 encoding of an empty
+// head is always the same two bytes, so it is only computed once.
+var emptyHeadResult = bufrw.toBufferResult(HeaderRW, {});
+
 module.exports = TChannelAsThrift;
 
 function TChannelAsThrift(opts) {
@@ -42,6 +46,9 @@ function TChannelAsThrift(opts) {
         'must pass source as an argument');
 
     self.spec = thriftify.parseSpec(opts.source);
+    // endpoint -> EndpointTypes, so the spec is only consulted once per
+    // endpoint rather than twice on every call
+    self.endpointTypes = Object.create(null);
 
     // Pulled off of things in `.register` and `.send` rather than passed in
     self.logger = null;
@@ -243,14 +250,33 @@ function TChannelThriftResponse(response, parseResult) {
     }
 }
 
-TChannelAsThrift.prototype._parse = function parse(opts) {
+TChannelAsThrift.prototype._getEndpointTypes =
+function _getEndpointTypes(endpoint) {
+    var self = this;
+
+    var types = self.endpointTypes[endpoint];
+    if (!types) {
+        types = self.endpointTypes[endpoint] = new EndpointTypes(
+            self.spec.getType(endpoint + '_args'),
+            self.spec.getType(endpoint + '_result')
+        );
+    }
+    return types;
+};
+
+function EndpointTypes(argsType, resultType) {
     var self = this;
 
-    var argsName = opts.endpoint + '_args';
-    var argsType = self.spec.getType(argsName);
+    self.argsType = argsType;
+    self.resultType = resultType;
+}
+
+TChannelAsThrift.prototype._parse = function parse(opts) {
+    var self = this;
 
-    var returnName = opts.endpoint + '_result';
-    var resultType = self.spec.getType(returnName);
+    var types = self._getEndpointTypes(opts.endpoint);
+    var argsType = types.argsType;
+    var resultType = types.resultType;
 
     var headRes = bufrw.fromBufferResult(HeaderRW, opts.head);
     if (headRes.err) {
@@ -315,15 +341,14 @@ TChannelAsThrift.prototype._parse = function parse(opts) {
 TChannelAsThrift.prototype._stringify = function stringify(opts) {
     var self = this;
 
-    var argsName = opts.endpoint + '_args';
-    var argsType = self.spec.getType(argsName);
+    var types = self._getEndpointTypes(opts.endpoint);
+    var argsType = types.argsType;
+    var resultType = types.resultType;
 
-    var returnName = opts.endpoint + '_result';
-    var resultType = self.spec.getType(returnName);
-
-    opts.head = opts.head || {};
-
-    var headRes = bufrw.toBufferResult(HeaderRW, opts.head);
+    var headRes = emptyHeadResult;
+    if (opts.head) {
+        headRes = bufrw.toBufferResult(HeaderRW, opts.head);
+    }
     if (headRes.err) {
         var headStringifyErr = errors.ThriftHeadStringifyError(headRes.err, {
             endpoint: opts.endpoint,
@@ -85,6 +85,7 @@ function TChannel(options) {
     self.errorEvent = self.defineEvent('error');
     self.listeningEvent = self.defineEvent('listening');
     self.connectionEvent = self.defineEvent('connection');
+    self.closeEvent = self.defineEvent('close');
 
     // self.outboundCallsSentStat = self.defineCounter('outbound.calls.sent');
     // self.outboundCallsSuccessStat = self.defineCounter('outbound.calls.success');
@@ -745,6 +746,7 @@ TChannel.prototype.close = function close(callback) {
     var self = this;
     assert(!self.destroyed, 'TChannel double close');
     self.destroyed = true;
+    self.closeEvent.emit(self);
 
     var counter = 1;
 
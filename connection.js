@@ -32,6 +32,10 @@ var States = require('./reqres_states');
 
 var TChannelConnectionBase = require('./connection_base');
 
+// upper bound on how much written data is held back while the socket is
+// corked before it is flushed early
+var MAX_CORKED_BYTES = 0x10000;
+
 function TChannelConnection(channel, socket, direction, socketRemoteAddr) {
     assert(socketRemoteAddr !== channel.hostPort,
         'refusing to create self connection'
@@ -58,6 +62,8 @@ function TChannelConnection(channel, socket, direction, socketRemoteAddr) {
     }
 
     self.socket = socket;
+    self.socketCorked = false;
+    self.socketCorkedBytes = 0;
     self.ephemeral = false;
 
     var opts = {
@@ -113,11 +119,10 @@ TChannelConnection.prototype.setupSocket = function setupSocket() {
         }));
 
         if (self.ephemeral) {
-            var peer = self.channel.peers.get(self.socketRemoteAddr);
+            var peer = self.channel.peers.delete(self.socketRemoteAddr);
             if (peer) {
                 peer.close(noop);
             }
-            self.channel.peers.delete(self.socketRemoteAddr);
         }
     }
 
@@ -131,8 +136,21 @@ function noop() {}
 TChannelConnection.prototype.setupHandler = function setupHandler() {
     var self = this;
 
+    // Frames written within the same tick are coalesced by corking the
+    // socket until the next tick, so that they go out in a single writev
+    // rather than one write per frame.  A large burst is flushed as soon as
+    // it passes MAX_CORKED_BYTES instead of piling up until the next tick.
     self.handler.write = function write(buf, done) {
+        if (!self.socketCorked) {
+            self.socketCorked = true;
+            self.socket.cork();
+            process.nextTick(uncorkSocket);
+        }
         self.socket.write(buf, null, done);
+        self.socketCorkedBytes += buf.length;
+        if (self.socketCorkedBytes >= MAX_CORKED_BYTES) {
+            self.uncorkSocket();
+        }
     };
 
     self.mach.emit = handleReadFrame;
@@ -165,6 +183,10 @@ TChannelConnection.prototype.setupHandler = function setupHandler() {
     //     .pipe(self.socket)
     //     ;
 
+    function uncorkSocket() {
+        self.uncorkSocket();
+    }
+
     function onTimedOut(err) {
         self.onTimedOut(err);
     }
@@ -198,6 +220,16 @@ TChannelConnection.prototype.setupHandler = function setupHandler() {
     }
 };
 
+TChannelConnection.prototype.uncorkSocket = function uncorkSocket() {
+    var self = this;
+
+    if (self.socketCorked) {
+        self.socketCorked = false;
+        self.socketCorkedBytes = 0;
+        self.socket.uncork();
+    }
+};
+
 TChannelConnection.prototype.sendProtocolError =
 function sendProtocolError(type, err) {
     var self = this;
@@ -471,6 +503,9 @@ TChannelConnection.prototype.resetAll = function resetAll(err) {
 
     self.closing = true;
     self.closeError = err;
+    // flush anything written this tick (e.g. a protocol error frame) before
+    // tearing the socket down
+    self.uncorkSocket();
     self.socket.destroy();
 
     var requests = self.ops.getRequests();
@@ -555,6 +590,7 @@ TChannelConnection.prototype.resetAll = function resetAll(err) {
     });
 
     self.ops.clear();
+    self.handler.clearStreaming();
 
     var errorCodeName = errors.classify(err);
     if (errorCodeName !== 'NetworkError' &&
@@ -600,3 +636,4 @@ InitOperation.prototype.onTimeout = function onTimeout(now) {
 };
 
 module.exports = TChannelConnection;
+module.exports.MAX_CORKED_BYTES = MAX_CORKED_BYTES;
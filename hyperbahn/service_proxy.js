@@ -213,10 +213,7 @@ function getServicePeer(serviceName, hostPort) {
 
 ServiceDispatchHandler.prototype._getServicePeer =
 function _getServicePeer(svcchan, hostPort) {
-    var peer = svcchan.peers.get(hostPort);
-    if (!peer) {
-        peer = svcchan.peers.add(hostPort);
-    }
+    var peer = svcchan.peers.add(hostPort);
     if (!peer.serviceProxyServices) {
         peer.serviceProxyServices = {};
     }
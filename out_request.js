@@ -26,7 +26,7 @@ var assert = require('assert');
 var EventEmitter = require('./lib/event_emitter');
 var stat = require('./lib/stat.js');
 var inherits = require('util').inherits;
-var parallel = require('run-parallel');
+var bufferArg23 = require('./argstream').bufferArg23;
 
 var errors = require('./errors');
 var States = require('./reqres_states');
@@ -499,12 +499,9 @@ TChannelOutRequest.prototype.hookupCallback = function hookupCallback(callback)
             callback(null, res, res.arg2, res.arg3);
             return;
         }
-        parallel({
-            arg2: res.arg2.onValueReady,
-            arg3: res.arg3.onValueReady
-        }, compatCall);
-        function compatCall(err, args) {
-            callback(err, res, args.arg2, args.arg3);
+        bufferArg23(res, compatCall);
+        function compatCall(err, arg2, arg3) {
+            callback(err, res, arg2, arg3);
         }
     }
 
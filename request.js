@@ -130,6 +130,10 @@ TChannelRequest.prototype.hookupCallback = function hookupCallback(callback) {
     function onResponse(res) {
         if (called) return;
         called = true;
+        if (!res.streamed) {
+            callback(null, res, res.arg2, res.arg3);
+            return;
+        }
         res.withArg23(function gotArg23(err, arg2, arg3) {
             callback(err, res, arg2, arg3);
         });
@@ -187,6 +191,19 @@ TChannelRequest.prototype.resend = function resend() {
         return;
     }
 
+    // common case: the chosen peer already has an identified connection, so
+    // there is nothing to wait for and no callback to allocate
+    var conn = peer.getIdentifiedOutConnection();
+    if (conn && conn.remoteName) {
+        self.onIdentified(peer);
+    } else {
+        self.waitForIdentified(peer);
+    }
+};
+
+TChannelRequest.prototype.waitForIdentified = function waitForIdentified(peer) {
+    var self = this;
+
     peer.waitForIdentified(onIdentified);
 
     function onIdentified(err) {
@@ -20,13 +20,13 @@
 
 'use strict';
 
-var parallel = require('run-parallel');
 var InResponse = require('./in_response');
 var inherits = require('util').inherits;
 
 var errors = require('./errors');
 var States = require('./reqres_states');
 var InArgStream = require('./argstream').InArgStream;
+var bufferArg23 = require('./argstream').bufferArg23;
 
 var emptyBuffer = Buffer(0);
 
@@ -83,13 +83,7 @@ StreamingInResponse.prototype.handleFrame = function handleFrame(parts, isLast)
 
 StreamingInResponse.prototype.withArg23 = function withArg23(callback) {
     var self = this;
-    parallel({
-        arg2: self.arg2.onValueReady,
-        arg3: self.arg3.onValueReady
-    }, compatCall);
-    function compatCall(err, args) {
-        callback(err, args.arg2, args.arg3);
-    }
+    bufferArg23(self, callback);
 };
 
 module.exports = StreamingInResponse;
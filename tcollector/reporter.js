@@ -24,9 +24,13 @@ var path = require('path');
 var fs = require('fs');
 var assert = require('assert');
 
+var errors = require('../errors.js');
+
 var tcollectorSpec =
     fs.readFileSync(path.join(__dirname, 'tcollector.thrift'), 'utf8');
 
+var DEFAULT_BATCH_SIZE = 64;
+
 module.exports = TCollectorTraceReporter;
 
 function TCollectorTraceReporter(options) {
@@ -46,6 +50,15 @@ function TCollectorTraceReporter(options) {
     self.logWarnings = 'logWarnings' in options ?
         options.logWarnings : true;
 
+    // When flushInterval is set, spans are queued and submitted together
+    // once per interval (or as soon as batchSize spans are pending) rather
+    // than one request per reported span.
+    self.flushInterval = options.flushInterval || 0;
+    self.batchSize = options.batchSize || DEFAULT_BATCH_SIZE;
+    self.pending = [];
+    self.flushTimer = null;
+    self.onFlushTimer = onFlushTimer;
+
     /*istanbul ignore if*/
     if (!self.channel) {
         // TODO: typederror or vld
@@ -55,6 +68,21 @@ function TCollectorTraceReporter(options) {
     self.tchannelThrift = new self.channel.TChannelAsThrift({
         source: tcollectorSpec
     });
+
+    if (self.flushInterval) {
+        self.channel.closeEvent.on(onChannelClose);
+    }
+
+    function onFlushTimer() {
+        self.flushTimer = null;
+        self.flush();
+    }
+
+    // fail anything still queued right away rather than when the timer
+    // next fires
+    function onChannelClose() {
+        self.flush();
+    }
 }
 
 TCollectorTraceReporter.ipToInt = function ipToInt(ip) {
@@ -79,38 +107,17 @@ TCollectorTraceReporter.convertHost = function convertHost(endpoint) {
 
 TCollectorTraceReporter.jsonSpanToThriftSpan =
 function jsonSpanToThriftSpan(span) {
-    var annotations = span.annotations.map(function fixAnnotation(item) {
-        return {
-            timestamp: item.timestamp,
-            value: item.value
-        };
-    });
+    var i;
 
-    var binaryAnnotations =
-        span.binaryAnnotations.map(function fixBinAnnotation(item) {
-            var ret = {
-                key: item.key,
-                annotationType: null,
-                boolValue: null,
-                intValue: null,
-                doubleValue: null,
-                stringValue: null,
-                bytesValue: null
-            };
-
-            if (item.type === 'boolean') {
-                ret.annotationType = 'BOOL';
-                ret.boolValue = item.value;
-            } else if (item.type === 'number') {
-                ret.annotationType = 'DOUBLE';
-                ret.doubleValue = item.value;
-            } else {
-                ret.annotationType = 'STRING';
-                ret.stringValue = String(item.value);
-            }
+    var annotations = new Array(span.annotations.length);
+    for (i = 0; i < annotations.length; i++) {
+        annotations[i] = fixAnnotation(span.annotations[i]);
+    }
 
-            return ret;
-        });
+    var binaryAnnotations = new Array(span.binaryAnnotations.length);
+    for (i = 0; i < binaryAnnotations.length; i++) {
+        binaryAnnotations[i] = fixBinAnnotation(span.binaryAnnotations[i]);
+    }
 
     var endpoint = span.endpoint || span.annotations[0].host;
     var host = TCollectorTraceReporter.convertHost(endpoint);
@@ -128,6 +135,38 @@ function jsonSpanToThriftSpan(span) {
     return mapped;
 };
 
+function fixAnnotation(item) {
+    return {
+        timestamp: item.timestamp,
+        value: item.value
+    };
+}
+
+function fixBinAnnotation(item) {
+    var ret = {
+        key: item.key,
+        annotationType: null,
+        boolValue: null,
+        intValue: null,
+        doubleValue: null,
+        stringValue: null,
+        bytesValue: null
+    };
+
+    if (item.type === 'boolean') {
+        ret.annotationType = 'BOOL';
+        ret.boolValue = item.value;
+    } else if (item.type === 'number') {
+        ret.annotationType = 'DOUBLE';
+        ret.doubleValue = item.value;
+    } else {
+        ret.annotationType = 'STRING';
+        ret.stringValue = String(item.value);
+    }
+
+    return ret;
+}
+
 TCollectorTraceReporter.prototype.report =
 function report(span, opts, callback) {
     var self = this;
@@ -137,13 +176,76 @@ function report(span, opts, callback) {
         opts = null;
     }
 
+    if (!self.flushInterval) {
+        self.submit(span, opts, callback);
+        return;
+    }
+
+    // convert now so that later changes to the span can't leak into the
+    // queued submission
+    self.pending.push(new PendingSpan(
+        TCollectorTraceReporter.jsonSpanToThriftSpan(span), opts, callback
+    ));
+    if (self.pending.length >= self.batchSize) {
+        self.flush();
+    } else if (!self.flushTimer) {
+        self.flushTimer = self.channel.timers.setTimeout(
+            self.onFlushTimer, self.flushInterval
+        );
+    }
+};
+
+TCollectorTraceReporter.prototype.flush = function flush() {
+    var self = this;
+
+    if (self.flushTimer) {
+        self.channel.timers.clearTimeout(self.flushTimer);
+        self.flushTimer = null;
+    }
+
+    var pending = self.pending;
+    self.pending = [];
+    var i;
+    var item;
+
+    // the channel may have been closed while spans were queued, and it can
+    // no longer make requests; fail the queued spans rather than submit them
+    if (self.channel.destroyed) {
+        for (i = 0; i < pending.length; i++) {
+            item = pending[i];
+            if (item.callback) {
+                item.callback(errors.TChannelDestroyedError());
+            }
+        }
+        return;
+    }
+
+    for (i = 0; i < pending.length; i++) {
+        item = pending[i];
+        self.sendSpan(item.span, item.opts, item.callback);
+    }
+};
+
+TCollectorTraceReporter.prototype.submit =
+function submit(span, opts, callback) {
+    var self = this;
+
+    self.sendSpan(
+        TCollectorTraceReporter.jsonSpanToThriftSpan(span), opts, callback
+    );
+};
+
+TCollectorTraceReporter.prototype.sendSpan =
+function sendSpan(span, opts, callback) {
+    var self = this;
+
     var req = self.channel.request({
         timeout: (opts && opts.timeout) || 100,
         trace: false,
         hasNoParent: true,
         headers: {
             cn: self.callerName,
-            shardKey: span.traceid.toString('base64')
+            shardKey: span.traceId.toString('base64')
         },
         serviceName: 'tcollector',
         retryLimit: 1,
@@ -154,7 +256,7 @@ function report(span, opts, callback) {
         req,
         'TCollector::submit',
         null,
-        {span: TCollectorTraceReporter.jsonSpanToThriftSpan(span)},
+        {span: span},
         onResponse
     );
 
@@ -189,3 +291,10 @@ function report(span, opts, callback) {
     }
 };
 
+function PendingSpan(span, opts, callback) {
+    var self = this;
+
+    self.span = span;
+    self.opts = opts;
+    self.callback = callback;
+}
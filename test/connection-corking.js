@@ -0,0 +1,127 @@
+// Copyright (c) 2015 Uber Technologies, Inc.
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+'use strict';
+
+var allocCluster = require('./lib/alloc-cluster.js');
+var v2 = require('../v2');
+var TChannelConnection = require('../connection.js');
+
+var MAX_CORKED_BYTES = TChannelConnection.MAX_CORKED_BYTES;
+
+allocCluster.test('frames written within one tick are all delivered', 2, function t(cluster, assert) {
+    var client = cluster.channels[0];
+    var server = cluster.channels[1];
+    var peer = client.peers.add(server.hostPort);
+
+    peer.waitForIdentified(function onIdentified(err) {
+        assert.ifError(err, 'no identify error');
+        setImmediate(sendPings);
+    });
+
+    function sendPings() {
+        var conn = peer.getIdentifiedOutConnection();
+        var ids = [];
+        var got = 0;
+
+        conn.pingResponseEvent.on(function onResponse(res) {
+            assert.equals(res.id, ids[got], 'ping response ' + got + ' in order');
+            if (++got === ids.length) {
+                assert.end();
+            }
+        });
+
+        for (var i = 0; i < 5; i++) {
+            ids.push(conn.ping());
+        }
+        assert.ok(conn.socketCorked, 'socket is corked until the next tick');
+    }
+});
+
+allocCluster.test('protocol error frame written just before a reset reaches the peer', 2, function t(cluster, assert) {
+    cluster.logger.whitelist('info', 'resetting connection');
+
+    var client = cluster.channels[0];
+    var server = cluster.channels[1];
+    var peer = client.peers.add(server.hostPort);
+
+    peer.waitForIdentified(function onIdentified(err) {
+        assert.ifError(err, 'no identify error');
+
+        var conn = peer.getIdentifiedOutConnection();
+        var serverConnKeys = Object.keys(server.serverConnections);
+        assert.equals(serverConnKeys.length, 1, 'server has one connection');
+        var serverConn = server.serverConnections[serverConnKeys[0]];
+
+        serverConn.handler.errorEvent.on(function onServerError(err) {
+            assert.equals(err.type, 'tchannel.protocol',
+                'peer got the protocol error frame');
+            assert.end();
+        });
+
+        conn.sendProtocolError('read', new Error('bad frame'));
+        assert.ok(conn.closing, 'connection was reset');
+    });
+});
+
+allocCluster.test('a burst over 64KiB is flushed before the next tick', 2, function t(cluster, assert) {
+    var client = cluster.channels[0];
+    var server = cluster.channels[1];
+    var peer = client.peers.add(server.hostPort);
+
+    peer.waitForIdentified(function onIdentified(err) {
+        assert.ifError(err, 'no identify error');
+        setImmediate(sendBurst);
+    });
+
+    function sendBurst() {
+        var conn = peer.getIdentifiedOutConnection();
+        // ping frames are header only
+        var numPings = MAX_CORKED_BYTES / v2.Frame.Overhead;
+        var got = 0;
+        var uncorks = 0;
+
+        var uncork = conn.socket.uncork;
+        conn.socket.uncork = function countedUncork() {
+            uncorks++;
+            return uncork.apply(this, arguments);
+        };
+
+        conn.pingResponseEvent.on(function onResponse() {
+            if (++got === numPings + 1) {
+                assert.end();
+            }
+        });
+
+        assert.equals(conn.socketCorked, false, 'socket starts uncorked');
+        for (var i = 0; i < numPings; i++) {
+            conn.ping();
+        }
+        assert.equals(conn.socketCorked, false,
+            'socket is uncorked once 64KiB is written');
+        assert.equals(conn.socketCorkedBytes, 0, 'corked byte count is reset');
+        assert.equals(uncorks, 1, 'uncorked before the next tick');
+
+        conn.ping();
+        assert.equals(conn.socketCorked, true, 'later writes cork again');
+        assert.equals(conn.socketCorkedBytes, v2.Frame.Overhead,
+            'only the later write is held back');
+    }
+});
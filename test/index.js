@@ -54,6 +54,7 @@ require('./ping.js');
 require('./permissions_cache.js');
 require('./connection-stats.js');
 require('./connection-with-statsd.js');
+require('./connection-corking.js');
 require('./request-error-context.js');
 require('./max-call-overhead.js');
 require('./non-zero-ttl.js');
@@ -71,6 +72,7 @@ require('./no_frag_arg1.js');
 require('./trace/basic_server.js');
 require('./trace/server_2_requests.js');
 require('./trace/outpeer_span_handle.js');
+require('./trace/span.js');
 
 require('./v2/frame.js');
 require('./v2/init.js');
@@ -85,6 +87,7 @@ require('./v2/ping.js');
 require('./v2/error_response.js');
 require('./v2/args.js');
 require('./v2/lazy_frame.js');
+require('./v2/handler.js');
 
 require('./hyperbahn/constructor.js');
 require('./hyperbahn/todo.js');
@@ -84,6 +84,70 @@ allocCluster.test('streaming echo w/ streaming callback', 2, function t(cluster,
     });
 });
 
+allocCluster.test('connection reset mid-stream drops streaming state', 2, function t(cluster, assert) {
+    cluster.logger.whitelist('info', 'resetting connection');
+    cluster.logger.whitelist('warn', 'Unexpected error after end for OutRequest');
+
+    var one = cluster.channels[0];
+    var two = cluster.channels[1];
+    var twoSub = two.makeSubChannel({
+        serviceName: 'wat'
+    });
+
+    var serverConn = null;
+    one.handler = stallingHandler(function onRequest(req) {
+        serverConn = req.connection;
+    });
+
+    var peer = two.peers.add(cluster.hosts[0]);
+    peer.waitForIdentified(function onId(err) {
+        assert.ifError(err, 'no identify error');
+
+        var conn = peer.getIdentifiedOutConnection();
+        conn.handler.callIncomingResponseEvent.on(function onResponseStart() {
+            setImmediate(resetMidStream);
+        });
+
+        var req = twoSub.request({
+            streamed: true,
+            hasNoParent: true,
+            host: peer.hostPort,
+            headers: {
+                as: 'raw',
+                cn: 'wat'
+            }
+        });
+        req.hookupCallback(function onResult() {
+            assert.fail('response should never complete');
+        });
+        req.sendArg1('foo');
+        req.arg2.write('partial head');
+
+        function resetMidStream() {
+            assert.equal(Object.keys(conn.handler.streamingRes).length, 1,
+                'client has a partial response');
+            assert.equal(Object.keys(serverConn.handler.streamingReq).length, 1,
+                'server has a partial request');
+
+            serverConn.closeEvent.on(onServerClose);
+            conn.resetAll();
+
+            assert.equal(Object.keys(conn.handler.streamingReq).length, 0,
+                'client streamingReq is empty after reset');
+            assert.equal(Object.keys(conn.handler.streamingRes).length, 0,
+                'client streamingRes is empty after reset');
+        }
+
+        function onServerClose() {
+            assert.equal(Object.keys(serverConn.handler.streamingReq).length, 0,
+                'server streamingReq is empty after reset');
+            assert.equal(Object.keys(serverConn.handler.streamingRes).length, 0,
+                'server streamingRes is empty after reset');
+            assert.end();
+        }
+    });
+});
+
 function partsTest(testCase, assert) {
     return function runSendTest(callback) {
         var options = extend({
@@ -171,6 +235,20 @@ function echoHandler() {
     return handler;
 }
 
+// starts a streamed response to each request without ever finishing either
+function stallingHandler(onRequest) {
+    var handler = EndpointHandler();
+    function foo(req, buildRes) {
+        var res = buildRes({streamed: true});
+        res.headers.as = 'raw';
+        res.setOk(true);
+        res.arg2.write('partial head');
+        onRequest(req);
+    }
+    handler.register('foo', {streamed: true}, foo);
+    return handler;
+}
+
 function spaceWords(str) {
     return str
         .split(/( +[^ ]+)/)
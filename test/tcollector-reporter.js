@@ -240,3 +240,206 @@ allocCluster.test('functional test', {
         }, 5);
     }
 });
+
+allocCluster.test('batched functional test', {
+    numPeers: 2,
+}, function t4(cluster, assert) {
+    var clientTChannel = cluster.channels[0];
+
+    var serverTChannel = cluster.channels[1];
+
+    var tcClientSubchan = clientTChannel.makeSubChannel({
+        peers: [serverTChannel.hostPort],
+        serviceName: 'tcollector'
+    });
+
+    var tcServerSubchan = serverTChannel.makeSubChannel({
+        serviceName: 'tcollector'
+    });
+
+    var reporter = TCollectorReporter({
+        logger: cluster.logger,
+        channel: tcClientSubchan,
+        callerName: 'tc-reporter',
+        flushInterval: 10,
+        batchSize: 3
+    });
+
+    var thrift = new serverTChannel.TChannelAsThrift({
+        source: tcollectorSpec
+    });
+
+    thrift.register(
+        tcServerSubchan,
+        'TCollector::submit',
+        {},
+        onSubmit
+    );
+
+    var numSubmits = 0;
+    var numReported = 0;
+
+    reporter.report(testSpan, onReported);
+    reporter.report(testSpan, onReported);
+    assert.equals(reporter.pending.length, 2, 'spans are queued');
+
+    reporter.report(testSpan, onReported);
+    assert.equals(reporter.pending.length, 0, 'full batch is flushed');
+
+    function onSubmit(opts, req, head, body, done) {
+        numSubmits++;
+        assert.deepEqual(body.span.id, testSpan.id);
+        done(null, {ok: true, body: {ok: true}});
+    }
+
+    function onReported(err) {
+        assert.ifError(err);
+        if (++numReported < 3) {
+            return;
+        }
+
+        assert.equals(numSubmits, 3, 'all spans submitted');
+        clientTChannel.close();
+        serverTChannel.close();
+        assert.end();
+    }
+});
+
+allocCluster.test('interval flush functional test', {
+    numPeers: 2,
+}, function t5(cluster, assert) {
+    var clientTChannel = cluster.channels[0];
+
+    var serverTChannel = cluster.channels[1];
+
+    var tcClientSubchan = clientTChannel.makeSubChannel({
+        peers: [serverTChannel.hostPort],
+        serviceName: 'tcollector'
+    });
+
+    var tcServerSubchan = serverTChannel.makeSubChannel({
+        serviceName: 'tcollector'
+    });
+
+    var reporter = TCollectorReporter({
+        logger: cluster.logger,
+        channel: tcClientSubchan,
+        callerName: 'tc-reporter',
+        flushInterval: 10
+    });
+
+    var thrift = new serverTChannel.TChannelAsThrift({
+        source: tcollectorSpec
+    });
+
+    thrift.register(
+        tcServerSubchan,
+        'TCollector::submit',
+        {},
+        onSubmit
+    );
+
+    var numSubmits = 0;
+    var numReported = 0;
+
+    reporter.report(testSpan, onReported);
+    reporter.report(testSpan, onReported);
+    assert.equals(reporter.pending.length, 2, 'spans are queued');
+    assert.ok(reporter.flushTimer, 'flush timer is set');
+
+    function onSubmit(opts, req, head, body, done) {
+        numSubmits++;
+        assert.equals(reporter.pending.length, 0, 'queue flushed by timer');
+        done(null, {ok: true, body: {ok: true}});
+    }
+
+    function onReported(err) {
+        assert.ifError(err);
+        if (++numReported < 2) {
+            return;
+        }
+
+        assert.equals(numSubmits, 2, 'all spans submitted');
+        assert.equals(reporter.flushTimer, null, 'flush timer is cleared');
+        clientTChannel.close();
+        serverTChannel.close();
+        assert.end();
+    }
+});
+
+allocCluster.test('queued spans fail once the channel is closed', {
+    numPeers: 2,
+}, function t6(cluster, assert) {
+    var clientTChannel = cluster.channels[0];
+
+    var serverTChannel = cluster.channels[1];
+
+    var tcClientSubchan = clientTChannel.makeSubChannel({
+        peers: [serverTChannel.hostPort],
+        serviceName: 'tcollector'
+    });
+
+    var reporter = TCollectorReporter({
+        logger: cluster.logger,
+        channel: tcClientSubchan,
+        callerName: 'tc-reporter',
+        flushInterval: 10
+    });
+
+    var reportErr = null;
+    reporter.report(testSpan, onReported);
+    clientTChannel.close();
+    serverTChannel.close();
+
+    assert.equals(reportErr && reportErr.type, 'tchannel.destroyed',
+        'queued span fails with a destroyed error on close');
+    assert.equals(reporter.pending.length, 0, 'queue is dropped');
+    assert.equals(reporter.flushTimer, null, 'flush timer is cleared');
+    assert.end();
+
+    function onReported(err) {
+        reportErr = err;
+    }
+});
+
+allocCluster.test('queued spans are not affected by later changes', {
+    numPeers: 2,
+}, function t7(cluster, assert) {
+    var clientTChannel = cluster.channels[0];
+
+    var serverTChannel = cluster.channels[1];
+
+    var tcClientSubchan = clientTChannel.makeSubChannel({
+        peers: [serverTChannel.hostPort],
+        serviceName: 'tcollector'
+    });
+
+    var reporter = TCollectorReporter({
+        logger: cluster.logger,
+        channel: tcClientSubchan,
+        callerName: 'tc-reporter',
+        flushInterval: 10
+    });
+
+    var span = {
+        name: 'endpoint',
+        traceid: testSpan.traceid,
+        parentid: testSpan.parentid,
+        id: testSpan.id,
+        annotations: testSpan.annotations.slice(),
+        binaryAnnotations: testSpan.binaryAnnotations.slice()
+    };
+
+    reporter.report(span);
+    span.name = 'changed';
+    span.annotations.push(testSpan.annotations[0]);
+
+    var queued = reporter.pending[0].span;
+    assert.equals(queued.name, 'endpoint', 'queued name is unchanged');
+    assert.equals(queued.annotations.length, testSpan.annotations.length,
+        'queued annotations are unchanged');
+
+    clientTChannel.close();
+    serverTChannel.close();
+    assert.end();
+});
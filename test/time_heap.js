@@ -94,6 +94,38 @@ test('TimeHeap works for all 7-permutations', function t(assert) {
     })).run(assert);
 });
 
+test('TimeHeap cancel removes items eagerly', function t(assert) {
+    var timers = TimeMock(1);
+    var heap = new TimeHeap({
+        timers: timers
+    });
+
+    var items = createTestTimeoutItems([1, 2, 3, 4, 5]);
+    var now = timers.now();
+    var handles = items.map(function each(item) {
+        return heap.update(item, now);
+    });
+
+    handles[0].cancel();
+    handles[3].cancel();
+    handles[3].cancel();
+    assert.equal(heap.end, 3, 'canceled items are removed from the heap');
+
+    now += 5;
+    timers.advance(5);
+    heap.callExpiredTimeouts(now);
+    assert.ok(!items[0].timedOut, 'canceled item did not time out');
+    assert.ok(!items[3].timedOut, 'canceled item did not time out');
+    assert.ok(items[1].timedOut && items[2].timedOut && items[4].timedOut,
+        'remaining items timed out');
+    assert.equal(heap.end, 0, 'heap is empty');
+
+    handles[1].cancel();
+    assert.equal(heap.end, 0, 'canceling an expired item is a no-op');
+
+    assert.end();
+});
+
 function TestTimeoutItem(t, name) {
     var self = this;
     self.timeout = t;
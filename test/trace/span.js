@@ -0,0 +1,91 @@
+// Copyright (c) 2015 Uber Technologies, Inc.
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+'use strict';
+
+var test = require('tape');
+
+var Agent = require('../../trace/agent.js');
+var Span = require('../../trace/span.js');
+
+function createSpan(flags) {
+    return new Span({
+        endpoint: new Span.Endpoint('127.0.0.1', 4040, 'test'),
+        name: 'test',
+        flags: flags
+    });
+}
+
+test('only sampled spans record annotations', function t(assert) {
+    var unsampled = createSpan(0);
+    var sampled = createSpan(1);
+
+    unsampled.annotate('cs');
+    unsampled.annotateBinary('as', 'raw');
+    sampled.annotate('cs');
+    sampled.annotateBinary('as', 'raw');
+
+    assert.equal(unsampled.annotations.length, 0,
+        'unsampled span has no annotations');
+    assert.equal(unsampled.binaryAnnotations.length, 0,
+        'unsampled span has no binary annotations');
+
+    assert.equal(sampled.annotations.length, 1,
+        'sampled span has an annotation');
+    assert.equal(sampled.annotations[0].value, 'cs',
+        'sampled span recorded cs');
+    assert.equal(sampled.binaryAnnotations.length, 1,
+        'sampled span has a binary annotation');
+    assert.equal(sampled.binaryAnnotations[0].key, 'as',
+        'sampled span recorded as');
+
+    assert.end();
+});
+
+test('child span sampled through its parent records annotations', function t(assert) {
+    var agent = new Agent({
+        serviceName: 'test'
+    });
+
+    var parent = createSpan(1);
+    parent.generateIds();
+
+    var child = agent.setupNewSpan({
+        outgoing: true,
+        parentSpan: parent,
+        spanid: null,
+        traceid: null,
+        parentid: null,
+        flags: 0,
+        remoteName: '127.0.0.1:4040',
+        serviceName: 'test',
+        name: 'child'
+    });
+
+    assert.equal(child.flags, 1, 'child inherits flags from its parent');
+
+    child.annotate('cs');
+    child.annotateBinary('cn', 'test');
+
+    assert.equal(child.annotations.length, 1, 'child recorded cs');
+    assert.equal(child.binaryAnnotations.length, 1, 'child recorded cn');
+
+    assert.end();
+});
@@ -0,0 +1,38 @@
+// Copyright (c) 2015 Uber Technologies, Inc.
+
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+
+'use strict';
+
+var test = require('tape');
+var v2 = require('../../v2/index.js');
+
+test('v2 handler: nextFrameId wraps around without yielding zero', function t(assert) {
+    var handler = new v2.Handler({});
+
+    assert.equal(handler.nextFrameId(), 1, 'first id is 1');
+    assert.equal(handler.nextFrameId(), 2, 'ids increment');
+
+    handler.lastSentFrameId = v2.Frame.MaxId - 1;
+    assert.equal(handler.nextFrameId(), v2.Frame.MaxId, 'MaxId is used');
+    assert.equal(handler.nextFrameId(), 1, 'wraps around to 1');
+
+    assert.end();
+});
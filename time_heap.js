@@ -62,6 +62,10 @@ var globalTimers = {
  * - push the new item and its expiration time onto the heap
  * - set a timer if there is none or the newly added item is the next to expire
  *
+ * It returns a TimeHeapElement handle whose .cancel() removes the item from
+ * the heap straight away, rather than leaving it to be skipped once expired;
+ * the timer is not re-armed for this unless the heap becomes empty.
+ *
  * TODO: shrink array if end is << array.length/2 (trigger in pop and/or a
  * sweep on an interval)
  */
@@ -83,6 +87,9 @@ TimeHeap.prototype.clear = function clear() {
     var self = this;
 
     self.timers.clearTimeout(self.timer);
+    for (var i = 0; i < self.end; i++) {
+        self.array[i].heap = null;
+    }
     self.array = [];
     self.expired = [];
     self.timer = null;
@@ -171,14 +178,17 @@ TimeHeap.prototype.callExpiredTimeouts = function callExpiredTimeouts(now) {
 TimeHeap.prototype.push = function push(item, expireTime) {
     var self = this;
 
+    // Elements are not recycled, which costs an allocation per update: callers
+    // do cancel handles for items that already expired (e.g. an out request
+    // is popped, and its handle canceled, after its own onTimeout), and with
+    // recycling such a stale cancel would remove an unrelated item.
     var i = self.end;
+    var el = new TimeHeapElement(self, i, expireTime, item);
     if (i >= self.array.length) {
-        i = self.array.length;
-        self.array.push(new TimeHeapElement());
+        self.array.push(el);
+    } else {
+        self.array[i] = el;
     }
-    var el = self.array[i];
-    el.expireTime = expireTime;
-    el.item = item;
     self.end = i + 1;
     return self.siftup(i);
 };
@@ -190,13 +200,33 @@ TimeHeap.prototype.pop = function pop() {
         return null;
     }
 
-    var el = self.array[0];
+    return self.remove(0);
+};
+
+TimeHeap.prototype.remove = function remove(i) {
+    var self = this;
+
+    var el = self.array[i];
     self.end--;
-    self.swap(0, self.end);
-    self.siftdown(0);
+    if (i !== self.end) {
+        self.swap(i, self.end);
+        self.siftdown(self.siftup(i));
+    }
+    self.array[self.end] = null;
+
+    // Only an empty heap clears the timer.  Removing the root of a non-empty
+    // heap leaves the timer armed for the old root, so it may fire early; it
+    // then finds nothing expired and re-arms for the new root.  That is at
+    // most one spurious wakeup per timer period, whereas re-arming on every
+    // root removal would cost a clearTimeout/setTimeout pair on the common
+    // path, where the earliest request is the first to complete.
+    if (!self.end && self.timer) {
+        self.timers.clearTimeout(self.timer);
+        self.timer = null;
+    }
 
     var item = el.item;
-    el.expireTime = 0;
+    el.heap = null;
     el.item = null;
     return item;
 };
@@ -248,13 +278,20 @@ TimeHeap.prototype.swap = function swap(i, j) {
     var tmp = self.array[i];
     self.array[i] = self.array[j];
     self.array[j] = tmp;
+    self.array[i].index = i;
+    self.array[j].index = j;
 };
 
-function TimeHeapElement() {
-    this.expireTime = 0;
-    this.item = null;
+function TimeHeapElement(heap, index, expireTime, item) {
+    this.heap = heap;
+    this.index = index;
+    this.expireTime = expireTime;
+    this.item = item;
 }
 
 TimeHeapElement.prototype.cancel = function cancel() {
+    if (this.heap) {
+        this.heap.remove(this.index);
+    }
     this.item = null;
 };
@@ -44,15 +44,13 @@ function Agent(options) {
     // incoming reuqests
     self.serviceName = options.serviceName || null;
 
-    if (options.reporter) {
-        self.reporter = options.reporter;
-    }
+    self.reporter = options.reporter || nullReporter;
 }
 
-function compareBufs(buf1, buf2) {
-    if (!buf2) return false;
-    return (buf1.readUInt32BE(0) === buf2.readUInt32BE(0)) &&
-        (buf1.readUInt32BE(4) === buf2.readUInt32BE(4));
+// Whether buf is an all zero 8 byte id, which means "no id" on the wire
+function isEmptyId(buf) {
+    if (!buf) return false;
+    return buf.readUInt32BE(0) === 0 && buf.readUInt32BE(4) === 0;
 }
 
 // ## setupNewSpan
@@ -63,16 +61,15 @@ Agent.prototype.setupNewSpan = function setupNewSpan(options) {
     var hostPortParts = options.remoteName.split(":");
     var host = hostPortParts[0], port = parseInt(hostPortParts[1], 10);
 
-    var empty = new Buffer([0, 0, 0, 0, 0, 0, 0, 0]);
-    if (compareBufs(empty, options.parentid)) {
+    if (isEmptyId(options.parentid)) {
         options.parentid = null;
     }
 
-    if (compareBufs(empty, options.traceid)) {
+    if (isEmptyId(options.traceid)) {
         options.traceid = null;
     }
 
-    if (compareBufs(empty, options.spanid)) {
+    if (isEmptyId(options.spanid)) {
         options.spanid = null;
     }
 
@@ -124,5 +121,7 @@ Agent.prototype.report = function report(span) {
     }
 };
 
-Agent.prototype.reporter = function nullReporter() {};
+Agent.prototype.reporter = nullReporter;
+
+function nullReporter() {}
 
@@ -35,19 +35,15 @@ function Span(options) {
 
     // TODO: options validation
 
-    if (options.id) {
-        self.id = options.id;
-    }
-
-    if (options.traceid) {
-        self.traceid = options.traceid;
-    }
-
+    // every field is assigned unconditionally and in the same order so that
+    // all spans share one hidden class
+    self.id = options.id || null;
+    self.traceid = options.traceid || null;
     self.endpoint = options.endpoint;
 
     self.name = options.name;
-    self.parentid = options.parentid;
-    if (!options.parentid) {
+    self.parentid = options.parentid || null;
+    if (!self.parentid) {
         self.parentid = new Buffer(8);
         self.parentid.fill(0);
     }
@@ -118,9 +114,13 @@ Span.prototype.getTracing = function getTracing() {
     };
 };
 
+// Only sampled spans (flags === 1) are ever reported, so annotating any
+// other span is wasted work on every call.
 Span.prototype.annotate = function annotate(value, timestamp) {
     var self = this;
 
+    if (self.flags !== 1) return;
+
     timestamp = timestamp || Date.now();
 
     self.annotations.push(new Annotation(value, self.endpoint, timestamp));
@@ -130,6 +130,8 @@ Span.prototype.annotateBinary =
 function annotateBinary(key, value, type) {
     var self = this;
 
+    if (self.flags !== 1) return;
+
     self.binaryAnnotations.push(new BinaryAnnotation(key, value, type, self.endpoint));
 };
 
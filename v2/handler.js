@@ -40,6 +40,13 @@ var errors = require('../errors');
 
 var SERVER_TIMEOUT_DEFAULT = 100;
 
+// Outgoing frames are serialized into a per connection buffer of one maximum
+// frame size.  Small frames are copied out of it, as the socket may hold on
+// to what it's given; frames filling more than half of it take the buffer
+// itself instead, since copying those costs about as much as replacing the
+// buffer does.
+var WRITE_HANDOFF_SIZE = v2.Frame.MaxSize / 2;
+
 /* jshint maxparams:10 */
 
 module.exports = TChannelV2Handler;
@@ -75,7 +82,7 @@ function TChannelV2Handler(options) {
     // TODO: GC these... maybe that's up to TChannel itself wrt ops
     self.streamingReq = Object.create(null);
     self.streamingRes = Object.create(null);
-    self.writeBuffer = new Buffer(v2.Frame.MaxSize);
+    self.writeBuffer = null;
 
     self.requireAs = self.options.requireAs === false ? false : true;
     self.requireCn = self.options.requireCn === false ? false : true;
@@ -88,15 +95,13 @@ TChannelV2Handler.prototype.write = function write() {
     self.errorEvent.emit(self, new Error('write not implemented'));
 };
 
-TChannelV2Handler.prototype.writeCopy = function writeCopy(buffer) {
-    var self = this;
-    var copy = new Buffer(buffer.length);
-    buffer.copy(copy);
-    self.write(copy);
-};
-
 TChannelV2Handler.prototype.pushFrame = function pushFrame(frame) {
     var self = this;
+
+    if (!self.writeBuffer) {
+        self.writeBuffer = new Buffer(v2.Frame.MaxSize);
+    }
+
     var writeBuffer = self.writeBuffer;
     var res = v2.Frame.RW.writeInto(frame, writeBuffer, 0);
     var err = res.err;
@@ -106,14 +111,30 @@ TChannelV2Handler.prototype.pushFrame = function pushFrame(frame) {
         self.writeErrorEvent.emit(self, err);
     } else {
         var buf = writeBuffer.slice(0, res.offset);
-        self.writeCopy(buf);
+        if (res.offset > WRITE_HANDOFF_SIZE) {
+            self.writeBuffer = null;
+        } else {
+            buf = copyBuffer(buf);
+        }
+        self.write(buf);
     }
 };
 
+function copyBuffer(buffer) {
+    var copy = new Buffer(buffer.length);
+    buffer.copy(copy);
+    return copy;
+}
+
 TChannelV2Handler.prototype.nextFrameId = function nextFrameId() {
     var self = this;
-    self.lastSentFrameId = (self.lastSentFrameId + 1) % v2.Frame.MaxId;
-    return self.lastSentFrameId;
+    // ids run 1..MaxId; 0 is never a valid call id and NullId is reserved
+    var id = self.lastSentFrameId + 1;
+    if (id > v2.Frame.MaxId) {
+        id = 1;
+    }
+    self.lastSentFrameId = id;
+    return id;
 };
 
 TChannelV2Handler.prototype.handleFrame = function handleFrame(frame) {
@@ -428,6 +449,15 @@ TChannelV2Handler.prototype.handleCallResponseCont = function handleCallResponse
     self._handleCallFrame(res, resFrame, self.streamingRes);
 };
 
+// Drops any partially received streaming requests and responses; these are
+// only ever removed by their last frame or an error frame, neither of which
+// will arrive once the connection has been reset.
+TChannelV2Handler.prototype.clearStreaming = function clearStreaming() {
+    var self = this;
+    self.streamingReq = Object.create(null);
+    self.streamingRes = Object.create(null);
+};
+
 TChannelV2Handler.prototype.handleClaim = function handleClaim(frame) {
     var self = this;
     self.claimEvent.emit(self, frame);
@@ -514,10 +544,14 @@ TChannelV2Handler.prototype._handleCallFrame = function _handleCallFrame(r, fram
 
     if (isLast) {
         delete streamingColl[r.id];
-    } else if (!streamingColl[r.id]) {
+        return true;
+    }
+
+    var existing = streamingColl[r.id];
+    if (!existing) {
         streamingColl[r.id] = r;
     } else {
-        assert(streamingColl[r.id] === r);
+        assert(existing === r);
     }
 
     return true;
@@ -571,15 +605,14 @@ function sendCallRequestFrame(req, flags, args) {
         req.checksum.type, args
     );
 
-    var result = self._sendCallBodies(req.id, reqBody, null);
-    req.checksum = result.checksum;
+    var size = self._sendCallBodies(req, reqBody, null);
 
     var channel = self.connection.channel;
 
     channel.emitFastStat(channel.buildStat(
         'tchannel.outbound.request.size',
         'counter',
-        result.size,
+        size,
         new stat.OutboundRequestSizeTags(
             req.serviceName,
             req.headers.cn,
@@ -587,12 +620,12 @@ function sendCallRequestFrame(req, flags, args) {
         )
     ));
 
-    self.emitBytesSent(result);
+    self.emitBytesSent(size);
     return null;
 };
 
 TChannelV2Handler.prototype.emitBytesSent =
-function emitBytesSent(result) {
+function emitBytesSent(size) {
     var self = this;
 
     var channel = self.connection.channel;
@@ -600,7 +633,7 @@ function emitBytesSent(result) {
         channel.emitFastStat(channel.buildStat(
             'tchannel.connections.bytes-sent',
             'counter',
-            result.size,
+            size,
             new stat.ConnectionsBytesSentTags(
                 channel.hostPort || '0.0.0.0:0',
                 self.connection.socketRemoteAddr
@@ -657,8 +690,7 @@ TChannelV2Handler.prototype.sendCallResponseFrame = function sendCallResponseFra
 
     self.validateCallResponseFrame(res);
 
-    var result = self._sendCallBodies(res.id, resBody, null);
-    res.checksum = result.checksum;
+    var size = self._sendCallBodies(res, resBody, null);
 
     var channel = self.connection.channel;
 
@@ -666,7 +698,7 @@ TChannelV2Handler.prototype.sendCallResponseFrame = function sendCallResponseFra
     channel.emitFastStat(channel.buildStat(
         'tchannel.outbound.response.size',
         'counter',
-        result.size,
+        size,
         new stat.OutboundResponseSizeTags(
             req.serviceName,
             req.headers.cn,
@@ -674,7 +706,7 @@ TChannelV2Handler.prototype.sendCallResponseFrame = function sendCallResponseFra
         )
     ));
 
-    self.emitBytesSent(result);
+    self.emitBytesSent(size);
 };
 
 TChannelV2Handler.prototype.validateCallResponseFrame =
@@ -701,8 +733,7 @@ TChannelV2Handler.prototype.sendCallRequestContFrame = function sendCallRequestC
         return;
     }
     var reqBody = new v2.CallRequestCont(flags, req.checksum.type, args);
-    var result = self._sendCallBodies(req.id, reqBody, req.checksum);
-    req.checksum = result.checksum;
+    var size = self._sendCallBodies(req, reqBody, req.checksum);
 
     var req0 = self.connection.ops.getOutReq(req.id);
 
@@ -710,7 +741,7 @@ TChannelV2Handler.prototype.sendCallRequestContFrame = function sendCallRequestC
     channel.emitFastStat(channel.buildStat(
         'tchannel.outbound.request.size',
         'counter',
-        result.size,
+        size,
         new stat.OutboundRequestSizeTags(
             req0 ? req0.serviceName : '',
             req0 ? req0.headers.cn : '',
@@ -718,7 +749,7 @@ TChannelV2Handler.prototype.sendCallRequestContFrame = function sendCallRequestC
         )
     ));
 
-    self.emitBytesSent(result);
+    self.emitBytesSent(size);
 };
 
 TChannelV2Handler.prototype.sendCallResponseContFrame = function sendCallResponseContFrame(res, flags, args) {
@@ -728,8 +759,7 @@ TChannelV2Handler.prototype.sendCallResponseContFrame = function sendCallRespons
         return;
     }
     var resBody = new v2.CallResponseCont(flags, res.checksum.type, args);
-    var result = self._sendCallBodies(res.id, resBody, res.checksum);
-    res.checksum = result.checksum;
+    var size = self._sendCallBodies(res, resBody, res.checksum);
 
     var req = res.inreq;
     var channel = self.connection.channel;
@@ -737,7 +767,7 @@ TChannelV2Handler.prototype.sendCallResponseContFrame = function sendCallRespons
     channel.emitFastStat(channel.buildStat(
         'tchannel.outbound.response.size',
         'counter',
-        result.size,
+        size,
         new stat.OutboundResponseSizeTags(
             req.serviceName,
             req.headers.cn,
@@ -745,10 +775,12 @@ TChannelV2Handler.prototype.sendCallResponseContFrame = function sendCallRespons
         )
     ));
 
-    self.emitBytesSent(result);
+    self.emitBytesSent(size);
 };
 
-TChannelV2Handler.prototype._sendCallBodies = function _sendCallBodies(id, body, checksum) {
+// Writes body and any continuation bodies split off of it, storing the final
+// running checksum on r; returns the number of bytes written.
+TChannelV2Handler.prototype._sendCallBodies = function _sendCallBodies(r, body, checksum) {
     var self = this;
     var frame;
 
@@ -759,22 +791,16 @@ TChannelV2Handler.prototype._sendCallBodies = function _sendCallBodies(id, body,
             body.csum = checksum;
         }
 
-        frame = new v2.Frame(id, body);
+        frame = new v2.Frame(r.id, body);
         self.pushFrame(frame);
         size += frame.size;
         checksum = body.csum;
     } while (body = body.cont);
 
-    return new CallBodiesResult(checksum, size);
+    r.checksum = checksum;
+    return size;
 };
 
-function CallBodiesResult(checksum, size) {
-    var self = this;
-
-    self.checksum = checksum;
-    self.size = size;
-}
-
 TChannelV2Handler.prototype.sendPingRequest = function sendPingRequest() {
     var self = this;
     var id = self.nextFrameId();